@@ -1,17 +1,109 @@
+import asyncio
+import collections
+import functools
+import io
 import json
+import queue
 import threading
 import time
 import urllib.error
-import urllib.parse
-import urllib.request
 import tkinter as tk
 from tkinter import ttk
 from tkinter import scrolledtext
 
 try:
-	from .client import RobotApiClient  # when run as a module
+	from .client import RobotApiClient, dumps_pretty, loads  # when run as a module
 except ImportError:
-	from client import RobotApiClient  # when run as a script
+	from client import RobotApiClient, dumps_pretty, loads  # when run as a script
+
+
+@functools.lru_cache(maxsize=64)
+def _summarize_http_error(code: int, body: bytes) -> str:
+	"""Build the concise (non-debug) message for an HTTP error response.
+
+	Cached because a disconnected or faulted robot tends to return the same
+	error for every request, e.g. while the user keeps retrying.
+	"""
+	msg = f"HTTP {code}"
+	try:
+		data = loads(body) if body else {}
+		message = data.get("message")
+		details = data.get("details")
+		parts = [msg]
+		if message:
+			parts.append(str(message))
+		if details:
+			parts.append(str(details))
+		return " - ".join(parts)
+	except Exception:
+		return f"{msg} - {body.decode('utf-8', errors='replace')}"
+
+
+def _format_http_status_error(err: urllib.error.HTTPError, debug: bool) -> str:
+	if not debug:
+		content_type = err.headers.get("Content-Type", "") if err.headers else ""
+		if "json" not in content_type:
+			# Non-JSON error pages (e.g. HTML 500s) carry no message worth showing
+			return f"HTTP {err.code} {err.reason}"
+	body = getattr(err, "_cached_body", None)
+	if body is None:
+		try:
+			body = err.read()
+		except Exception:
+			body = b"<no body>"
+	if debug:
+		# Include more context: status, url, headers, body
+		status = f"HTTP {err.code}"
+		url = getattr(err, 'url', '') or ''
+		headers = "\n".join([f"{k}: {v}" for k, v in (err.headers.items() if err.headers else [])])
+		return f"{status} {url}\n{headers}\n\n{body.decode('utf-8', errors='replace')}"
+	# Non-debug: the raw bytes are parsed directly and only decoded if they aren't JSON
+	return _summarize_http_error(err.code, body)
+
+
+def _format_network_error(err: urllib.error.URLError, debug: bool) -> str:
+	reason = getattr(err, 'reason', err)
+	return f"Network error: {reason}"
+
+
+def _format_generic_error(err: Exception, debug: bool) -> str:
+	return f"Error: {err}"
+
+
+# Error formatters keyed by exception type; see RemoteRobotControllerApp._format_http_error
+_ERROR_FORMATTERS = {
+	urllib.error.HTTPError: _format_http_status_error,
+	urllib.error.URLError: _format_network_error,
+}
+
+
+# Log widget limits: pending lines are flushed every LOG_FLUSH_MS and the
+# widget keeps at most LOG_MAX_LINES lines, dropping the oldest first.
+LOG_FLUSH_MS = 50
+LOG_MAX_LINES = 5000
+
+# Interval between program state polls while Auto-refresh is enabled
+AUTO_REFRESH_MS = 1000
+
+# Tcl procedure that appends a batch of text to the read-only log widget,
+# trims it to max_lines and scrolls to the end in a single interpreter call.
+_LOG_APPEND_PROC = """
+proc ::rrc_log_append {w text max_lines} {
+	$w configure -state normal
+	$w insert end $text
+	# "end-1c" sits on the empty line after the trailing newline
+	set excess [expr {int([$w index end-1c]) - 1 - $max_lines}]
+	if {$excess > 0} {
+		$w delete 1.0 "[expr {$excess + 1}].0"
+	}
+	$w see end
+	$w configure -state disabled
+}
+"""
+
+# Worker threads shared by all blocking API calls (also bounds the number of
+# keep-alive connections the client opens to the controller).
+API_MAX_WORKERS = 4
 
 
 # Action constants
@@ -30,6 +122,30 @@ class ProgramAction:
 	RESUME = "resume"
 
 
+# Button tables: (action, label, initial log message, success log message),
+# built once at import so the UI only binds them
+ROBOT_ACTION_BUTTONS = tuple(
+	(action, action, f"Sending robot state action: {action}", f"Robot state action '{action}' succeeded.")
+	for action in (
+		RobotStateAction.UNLOCK_PROTECTIVE_STOP,
+		RobotStateAction.RESTART_SAFETY,
+		RobotStateAction.POWER_OFF,
+		RobotStateAction.POWER_ON,
+		RobotStateAction.BRAKE_RELEASE,
+	)
+)
+
+PROGRAM_ACTION_BUTTONS = tuple(
+	(action, action.capitalize(), f"Sending program action: {action}", f"Program action '{action}' succeeded.")
+	for action in (
+		ProgramAction.PLAY,
+		ProgramAction.PAUSE,
+		ProgramAction.STOP,
+		ProgramAction.RESUME,
+	)
+)
+
+
 class _Tooltip:
 	def __init__(self, widget: tk.Widget, text: str) -> None:
 		self.widget = widget
@@ -38,45 +154,139 @@ class _Tooltip:
 		self.widget.bind("<Enter>", self._show)
 		self.widget.bind("<Leave>", self._hide)
 		self.widget.bind("<ButtonPress>", self._hide)
+		self.widget.bind("<Destroy>", self._forget, add="+")
 
 	def _show(self, _event=None) -> None:
-		if self.tipwindow or not self.text:
+		if not self.text:
 			return
 		x = self.widget.winfo_rootx() + 20
 		y = self.widget.winfo_rooty() + self.widget.winfo_height() + 4
-		self.tipwindow = tw = tk.Toplevel(self.widget)
-		tw.wm_overrideredirect(True)
-		tw.wm_geometry(f"+{x}+{y}")
-		label = tk.Label(
-			tw,
-			text=self.text,
-			justify=tk.LEFT,
-			background="#ffffe0",
-			relief=tk.SOLID,
-			borderwidth=1,
-			padx=6,
-			pady=4,
-			wraplength=320,
-		)
-		label.pack(ipadx=1)
+		if self.tipwindow is None:
+			# Build the tooltip once and withdraw/deiconify it on later hovers
+			self.tipwindow = tw = tk.Toplevel(self.widget)
+			tw.wm_overrideredirect(True)
+			label = tk.Label(
+				tw,
+				text=self.text,
+				justify=tk.LEFT,
+				background="#ffffe0",
+				relief=tk.SOLID,
+				borderwidth=1,
+				padx=6,
+				pady=4,
+				wraplength=320,
+			)
+			label.pack(ipadx=1)
+		self.tipwindow.wm_geometry(f"+{x}+{y}")
+		self.tipwindow.wm_deiconify()
 
 	def _hide(self, _event=None) -> None:
 		if self.tipwindow:
-			self.tipwindow.destroy()
-			self.tipwindow = None
+			self.tipwindow.wm_withdraw()
+
+	def _forget(self, _event=None) -> None:
+		# The Toplevel is a child of the widget and is destroyed along with it
+		self.tipwindow = None
 
 
 def attach_tooltip(widget: tk.Widget, text: str) -> None:
 	_Tooltip(widget, text)
 
 
+class AsyncTk(tk.Tk):
+	"""Tk root window that also drives an asyncio event loop.
+
+	The loop is pumped from an ``after`` timer on the Tk thread, so coroutines
+	and their done callbacks run on the Tk thread and may touch widgets directly.
+	The timer runs fast only while tasks are pending and is kicked immediately
+	when a task is created, so an idle window wakes up rarely.
+	"""
+
+	PUMP_INTERVAL_MS = 10  # while tasks are pending
+	IDLE_PUMP_INTERVAL_MS = 250  # nothing in flight
+
+	def __init__(self, *args, **kwargs) -> None:
+		super().__init__(*args, **kwargs)
+		self.loop = asyncio.new_event_loop()
+		self._busy = False
+		self._pump_after_id = self.after(self.IDLE_PUMP_INTERVAL_MS, self._pump)
+
+	def create_task(self, coro) -> asyncio.Task:
+		"""Schedule coro on the loop and start pumping as soon as Tk is idle."""
+		task = self.loop.create_task(coro)
+		# Inside _pump (e.g. from a done callback) the pump reschedules itself
+		if not self.loop.is_running():
+			self.after_cancel(self._pump_after_id)
+			self._pump_after_id = self.after_idle(self._pump)
+		return task
+
+	def _pump(self) -> None:
+		# Run one loop iteration (everything ready now), then yield back to Tk
+		self.loop.call_soon(self.loop.stop)
+		self.loop.run_forever()
+		# Stay fast for one extra tick after the last task finishes: its done
+		# callbacks are only queued during the iteration that completed it.
+		was_busy, self._busy = self._busy, bool(asyncio.all_tasks(self.loop))
+		interval = self.PUMP_INTERVAL_MS if (self._busy or was_busy) else self.IDLE_PUMP_INTERVAL_MS
+		self._pump_after_id = self.after(interval, self._pump)
+
+
+class _ApiWorkerPool:
+	"""A few long-lived daemon threads that run blocking calls for an asyncio loop.
+
+	Jobs are fed through a queue and each result is handed back to the loop
+	with call_soon_threadsafe. Daemon threads don't hold up interpreter exit,
+	so closing the window ends the process even while a call is still
+	waiting on the network.
+	"""
+
+	def __init__(self, loop: asyncio.AbstractEventLoop, size: int) -> None:
+		self._loop = loop
+		self._jobs: queue.Queue = queue.Queue()
+		for i in range(size):
+			threading.Thread(target=self._work, name=f"api-{i}", daemon=True).start()
+
+	def submit(self, fn, *args) -> asyncio.Future:
+		"""Queue fn(*args) for a worker thread and return a future on the loop."""
+		future = self._loop.create_future()
+		self._jobs.put((future, fn, args))
+		return future
+
+	def _work(self) -> None:
+		while True:
+			future, fn, args = self._jobs.get()
+			if future.cancelled():
+				continue  # cancelled while queued, e.g. an abandoned prefetch
+			try:
+				result = fn(*args)
+			except BaseException as exc:
+				self._loop.call_soon_threadsafe(self._settle, future, None, exc)
+			else:
+				self._loop.call_soon_threadsafe(self._settle, future, result, None)
+
+	@staticmethod
+	def _settle(future: asyncio.Future, result, exc: BaseException | None) -> None:
+		if future.done():
+			return  # cancelled while the call was running
+		if exc is None:
+			future.set_result(result)
+		else:
+			future.set_exception(exc)
+
+
 class RemoteRobotControllerApp:
-	def __init__(self, root: tk.Tk) -> None:
+	def __init__(self, root: AsyncTk) -> None:
 		self.root = root
 		self.root.title("Remote Robot Controller")
 
 		self.client = RobotApiClient()
 
+		# asyncio loop driven by the Tk main loop (see AsyncTk). Blocking client
+		# calls run on a fixed set of worker threads, so threads are reused and
+		# independent calls can be awaited together.
+		self._loop = root.loop
+		self._workers = _ApiWorkerPool(self._loop, API_MAX_WORKERS)
+
 		# Top connection frame
 		conn_frame = ttk.Frame(self.root, padding=8)
 		conn_frame.grid(row=0, column=0, sticky="nsew")
@@ -149,18 +359,16 @@ class RemoteRobotControllerApp:
 		refresh_robot_status_button = ttk.Button(status_row, text="Refresh", command=self.on_refresh_robot_status)
 		refresh_robot_status_button.grid(row=0, column=2, padx=(0, 8))
 
-		robot_actions = [
-			RobotStateAction.UNLOCK_PROTECTIVE_STOP,
-			RobotStateAction.RESTART_SAFETY,
-			RobotStateAction.POWER_OFF,
-			RobotStateAction.POWER_ON,
-			RobotStateAction.BRAKE_RELEASE,
-		]
-		for idx, action in enumerate(robot_actions):
+		for idx, (action, label, initial_message, success_message) in enumerate(ROBOT_ACTION_BUTTONS):
 			btn = ttk.Button(
 				robot_frame, 
-				text=action, 
-				command=lambda a=action: self._send_robot_state_action(a)
+				text=label, 
+				command=functools.partial(
+					self._dispatch_action,
+					functools.partial(self.client.set_robot_state, action),
+					initial_message,
+					success_message,
+				),
 			)
 			btn.grid(row=1, column=idx, padx=(0, 6), pady=(0, 2), sticky="w")
 
@@ -186,17 +394,16 @@ class RemoteRobotControllerApp:
 		# Program actions
 		actions_frame = ttk.Frame(program_frame)
 		actions_frame.grid(row=1, column=0, columnspan=3, pady=(8, 0), sticky="w")
-		program_actions = [
-			ProgramAction.PLAY,
-			ProgramAction.PAUSE,
-			ProgramAction.STOP,
-			ProgramAction.RESUME,
-		]
-		for idx, action in enumerate(program_actions):
+		for idx, (action, label, initial_message, success_message) in enumerate(PROGRAM_ACTION_BUTTONS):
 			btn = ttk.Button(
 				actions_frame, 
-				text=action.capitalize(), 
-				command=lambda a=action: self._send_program_action(a)
+				text=label, 
+				command=functools.partial(
+					self._dispatch_action,
+					functools.partial(self.client.set_program_action, action),
+					initial_message,
+					success_message,
+				),
 			)
 			btn.grid(row=0, column=idx, padx=(0, 6))
 
@@ -208,6 +415,13 @@ class RemoteRobotControllerApp:
 		self.program_state_label.grid(row=0, column=0, padx=(0, 8))
 		self.refresh_state_button = ttk.Button(state_frame, text="Refresh", command=self.on_refresh_program_state)
 		self.refresh_state_button.grid(row=0, column=1)
+		self.auto_refresh_var = tk.BooleanVar(value=False)
+		self.auto_refresh_check = ttk.Checkbutton(state_frame, text="Auto-refresh", variable=self.auto_refresh_var, command=self.on_toggle_auto_refresh)
+		self.auto_refresh_check.grid(row=0, column=2, padx=(8, 0))
+		self.auto_refresh_check.state(["disabled"])  # enabled once connected
+		attach_tooltip(self.auto_refresh_check, "Poll the program state every second (available once connected). Polls reuse the open connection and are not logged, even in Debug mode; auto-refresh stops on the first error.")
+		self._auto_refresh_after_id: str | None = None
+		self._auto_refresh_in_flight = False
 
 		# Separator
 		separator4 = ttk.Separator(self.root, orient="horizontal")
@@ -235,11 +449,20 @@ class RemoteRobotControllerApp:
 		debug_row = ttk.Frame(log_frame)
 		debug_row.grid(row=0, column=0, sticky="ew")
 		self.debug_var = tk.BooleanVar(value=False)
+		# Python-side mirror of debug_var so completion handlers don't query Tcl per call
+		self._debug = False
+		self.debug_var.trace_add("write", self._on_debug_toggled)
 		self.debug_check = ttk.Checkbutton(debug_row, text="Debug", variable=self.debug_var)
 		self.debug_check.grid(row=0, column=0, sticky="w")
 		attach_tooltip(self.debug_check, "When enabled, logs will include full HTTP details (status, URL, headers, and body) for troubleshooting. Disable for concise user-friendly messages.")
 
 		self.log_widget = scrolledtext.ScrolledText(log_frame, height=8, wrap="word", state="disabled")
+		self.log_widget.tk.eval(_LOG_APPEND_PROC)
+		self._log_queue: collections.deque[str] = collections.deque()
+		self._log_flush_scheduled = False
+		# Formatted timestamp cached for the current wall-clock second
+		self._ts_sec = 0
+		self._ts_str = ""
 		self.log_widget.grid(row=1, column=0, sticky="nsew")
 		log_frame.grid_rowconfigure(1, weight=1)
 		log_frame.grid_columnconfigure(0, weight=1)
@@ -251,24 +474,43 @@ class RemoteRobotControllerApp:
 		# Keyboard shortcuts
 		self.root.bind("<Return>", lambda _e: self.on_connect())
 
+		self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+	def _on_debug_toggled(self, *_args) -> None:
+		self._debug = self.debug_var.get()
+
 	def set_indicator(self, color: str) -> None:
 		self.indicator_canvas.itemconfig(self.indicator_oval, fill=color)
 
 	def append_log(self, message: str) -> None:
-		self.log_widget.configure(state="normal")
-		timestamp = time.strftime("%H:%M:%S")
-		self.log_widget.insert("end", f"[{timestamp}] {message}\n")
-		self.log_widget.see("end")
-		self.log_widget.configure(state="disabled")
+		"""Queue a timestamped message; queued messages are written to the widget in batches."""
+		now = int(time.time())
+		if now != self._ts_sec:
+			self._ts_sec = now
+			self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+		self._log_queue.append(f"[{self._ts_str}] {message}")
+		if not self._log_flush_scheduled:
+			self._log_flush_scheduled = True
+			self.root.after(LOG_FLUSH_MS, self._flush_log)
+
+	def _flush_log(self) -> None:
+		self._log_flush_scheduled = False
+		if not self._log_queue:
+			return
+		text = "\n".join(self._log_queue) + "\n"
+		self._log_queue.clear()
+		# Text is passed as a Tcl argument, never interpolated into a script
+		self.log_widget.tk.call("::rrc_log_append", str(self.log_widget), text, LOG_MAX_LINES)
 
 	def clear_log(self) -> None:
-		self.log_widget.configure(state="normal")
-		self.log_widget.delete("1.0", "end")
-		self.log_widget.configure(state="disabled")
+		self._log_queue.clear()
+		# Enable, wipe and disable the widget in one Tcl evaluation; widget path
+		# names never contain whitespace or Tcl metacharacters.
+		w = str(self.log_widget)
+		self.log_widget.tk.eval(f"{w} configure -state normal; {w} delete 1.0 end; {w} configure -state disabled")
 
-	def _format_http_success(self, response_body: dict) -> str:
+	def _format_http_success(self, response_body: dict, metadata: dict) -> str:
 		"""Format successful HTTP response for debug logging."""
-		metadata = self.client.get_last_response_metadata()
 		if not metadata:
 			return ""
 		
@@ -278,69 +520,115 @@ class RemoteRobotControllerApp:
 		headers = metadata.get("headers", {})
 		request_body = metadata.get("request_body")
 		
-		parts = [f"HTTP {status} {method} {url}"]
+		buf = io.StringIO()
+		buf.write(f"HTTP {status} {method} {url}")
 		
 		# Request details
 		if request_body:
-			parts.append(f"\nRequest Body:\n{json.dumps(request_body, indent=2)}")
+			buf.write("\nRequest Body:\n")
+			buf.write(dumps_pretty(request_body))
 		
 		# Response headers
-		headers_str = "\n".join([f"{k}: {v}" for k, v in headers.items()])
-		parts.append(f"\nResponse Headers:\n{headers_str}")
+		buf.write("\nResponse Headers:")
+		for k, v in headers.items():
+			buf.write(f"\n{k}: {v}")
 		
 		# Response body
 		if response_body:
-			body_str = json.dumps(response_body, indent=2) if isinstance(response_body, dict) else str(response_body)
-			parts.append(f"\nResponse Body:\n{body_str}")
+			buf.write("\nResponse Body:\n")
+			buf.write(dumps_pretty(response_body) if isinstance(response_body, (dict, list)) else str(response_body))
 		
-		return "".join(parts)
+		return buf.getvalue()
 
 	@staticmethod
 	def _format_http_error(err: Exception, debug: bool = False) -> str:
-		if isinstance(err, urllib.error.HTTPError):
-			try:
-				body = err.read().decode("utf-8", errors="replace")
-			except Exception:
-				body = "<no body>"
-			if debug:
-				# Include more context: status, url, headers, body
-				status = f"HTTP {err.code}"
-				url = getattr(err, 'url', '') or ''
-				headers = "\n".join([f"{k}: {v}" for k, v in (err.headers.items() if err.headers else [])])
-				return f"{status} {url}\n{headers}\n\n{body}"
-			# Non-debug: try to parse JSON message/details
-			msg = f"HTTP {err.code}"
-			try:
-				data = json.loads(body) if body else {}
-				message = data.get("message")
-				details = data.get("details")
-				parts = [msg]
-				if message:
-					parts.append(str(message))
-				if details:
-					parts.append(str(details))
-				return " - ".join(parts)
-			except Exception:
-				return f"{msg} - {body}"
-		if isinstance(err, urllib.error.URLError):
-			reason = getattr(err, 'reason', err)
-			return f"Network error: {reason}"
-		return f"Error: {err}"
-
-	def _run_async(self, worker, on_success=None, on_error=None, on_finally=None) -> None:
-		"""Execute a worker function asynchronously with optional callbacks."""
-		def target():
+		fmt = _ERROR_FORMATTERS.get(type(err))
+		if fmt is None:
+			# Subclasses (e.g. ContentTooShortError) resolve through the MRO
+			fmt = next(
+				(_ERROR_FORMATTERS[cls] for cls in type(err).__mro__ if cls in _ERROR_FORMATTERS),
+				_format_generic_error,
+			)
+		return fmt(err, debug)
+
+	async def _run_blocking(self, api_call, quiet: bool = False):
+		"""Run a blocking client call on the API worker pool and return its result.
+
+		In debug mode the response is logged here, one block per call, so
+		concurrent calls each show their own request and headers; quiet skips it.
+		"""
+		debug = self._debug and not quiet
+		result, metadata = await self._workers.submit(self._call_with_buffered_errors, api_call, debug)
+		if metadata is not None:
+			debug_info = self._format_http_success(result, metadata)
+			if debug_info:
+				self.append_log(debug_info)
+		return result
+
+	def _call_with_buffered_errors(self, api_call, debug: bool):
+		"""Invoke api_call on a worker thread and return (result, debug metadata or None).
+
+		Any HTTPError body is read here, since the error is formatted on the Tk
+		thread, which must never block on a socket read. The client keeps
+		response metadata per thread, so it is also collected here.
+		"""
+		try:
+			result = api_call()
+		except urllib.error.HTTPError as err:
+			err._cached_body = err.read()
+			raise
+		return result, self.client.get_last_response_metadata() if debug else None
+
+	async def _gather_blocking(self, *api_calls) -> list:
+		"""Run several blocking client calls concurrently and return their results in order."""
+		return await asyncio.gather(*(self._run_blocking(call) for call in api_calls))
+
+	async def _fetch_initial_state(self) -> dict:
+		"""Fetch the program state and prefetch the status modes concurrently.
+
+		The program state doubles as the connectivity check: it is submitted
+		first and awaited on its own, so a failure is reported without waiting
+		on the mode lookups, which are then cancelled. The mode lookups are
+		best-effort and are None on failure.
+		"""
+		state_task = asyncio.ensure_future(self._run_blocking(self.client.get_program_state))
+		mode_tasks = {
+			"safety_mode": asyncio.ensure_future(self._run_blocking(self.client.get_safety_mode)),
+			"robot_mode": asyncio.ensure_future(self._run_blocking(self.client.get_robot_mode)),
+			"control_mode": asyncio.ensure_future(self._run_blocking(self.client.get_control_mode)),
+			"operational_mode": asyncio.ensure_future(self._run_blocking(self.client.get_operational_mode)),
+		}
+		try:
+			state = {"program_state": await state_task}
+		except BaseException:
+			for task in mode_tasks.values():
+				task.cancel()
+			raise
+		results = await asyncio.gather(*mode_tasks.values(), return_exceptions=True)
+		state.update((name, None if isinstance(result, BaseException) else result) for name, result in zip(mode_tasks, results))
+		return state
+
+	def _submit_coro(self, coro, on_success=None, on_error=None, on_finally=None) -> None:
+		"""Schedule a coroutine on the Tk-driven loop.
+
+		The task runs on the Tk thread, so the success/error callback and
+		on_finally are invoked directly when it completes.
+		"""
+		task = self.root.create_task(coro)
+
+		def deliver(f) -> None:
 			try:
-				result = worker()
-				if on_success:
-					self.root.after(0, on_success, result)
-			except Exception as exc:  # noqa: BLE001
-				if on_error:
-					self.root.after(0, on_error, exc)
+				exc = f.exception()
+				if exc is None:
+					if on_success:
+						on_success(f.result())
+				elif on_error:
+					on_error(exc)
 			finally:
 				if on_finally:
-					self.root.after(0, on_finally)
-		threading.Thread(target=target, daemon=True).start()
+					on_finally()
+
+		task.add_done_callback(deliver)
 
 	def _execute_api_call(
 		self,
@@ -350,16 +638,20 @@ class RemoteRobotControllerApp:
 		on_success_callback=None,
 		on_error_callback=None,
 		on_finally=None,
+		quiet: bool = False,
 	) -> None:
 		"""Execute an API call with standard logging and error handling.
 		
 		Args:
-			api_call: Function that makes the API call and returns response
+			api_call: Function that makes the API call and returns response, a tuple of
+				such functions to run concurrently (callbacks then receive a list of responses),
+				or a coroutine whose result is passed to the callbacks
 			initial_message: Optional message to log before making the call
 			success_message: Message to log on success
 			on_success_callback: Optional callback to execute on success (in addition to logging)
 			on_error_callback: Optional callback to execute on error (in addition to logging)
 			on_finally: Optional callback to execute in finally block
+			quiet: Skip the debug response block for a single call (used by polling)
 		"""
 		if initial_message:
 			self.append_log(initial_message)
@@ -367,54 +659,86 @@ class RemoteRobotControllerApp:
 		def success(resp):
 			if success_message:
 				self.append_log(success_message)
-			if self.debug_var.get():
-				debug_info = self._format_http_success(resp)
-				if debug_info:
-					self.append_log(debug_info)
 			if on_success_callback:
 				on_success_callback(resp)
 
 		def error(err: Exception):
-			self.append_log(self._format_http_error(err, debug=self.debug_var.get()))
+			self.append_log(self._format_http_error(err, debug=self._debug))
 			if on_error_callback:
 				on_error_callback(err)
 
-		self._run_async(api_call, on_success=success, on_error=error, on_finally=on_finally)
+		if asyncio.iscoroutine(api_call):
+			coro = api_call
+		elif isinstance(api_call, tuple):
+			coro = self._gather_blocking(*api_call)
+		else:
+			coro = self._run_blocking(api_call, quiet=quiet)
+		self._submit_coro(coro, on_success=success, on_error=error, on_finally=on_finally)
 
 	# Handlers
+	def on_close(self) -> None:
+		"""Close idle connections, then the window.
+
+		Calls still in flight are abandoned; their worker threads are daemons,
+		so they don't keep the process alive.
+		"""
+		self._stop_auto_refresh()
+		self.client.close()
+		self.root.destroy()
+
 	def on_connect(self) -> None:
 		host = self.host_var.get().strip()
 		if not host:
 			self.append_log("Please enter a robot host/IP.")
 			return
 
-		self.connect_button.configure(state="disabled")
-		self.connection_status_var.set("Connecting...")
-		self.set_indicator("orange")
+		self._apply_connect_ui("Connecting...", "orange", "disabled")
 		self.client.set_host(host)
 
-		def on_success_callback(_resp):
-			self.set_indicator("green")
-			self.connection_status_var.set("Connection Success")
-
-		def on_error_callback(_err):
-			self.set_indicator("red")
-			self.connection_status_var.set("Connection Failed")
-
 		self._execute_api_call(
-			api_call=self.client.get_program_state,
+			api_call=self._fetch_initial_state(),
 			success_message="Connected successfully.",
-			on_success_callback=on_success_callback,
-			on_error_callback=on_error_callback,
-			on_finally=lambda: self.connect_button.configure(state="normal"),
+			on_success_callback=self._on_connect_succeeded,
+			on_error_callback=self._on_connect_failed,
 		)
 
-	def _send_robot_state_action(self, action: str) -> None:
-		"""Generic handler for robot state actions."""
+	def _on_connect_succeeded(self, state: dict) -> None:
+		self._apply_connect_ui("Connection Success", "green", "normal")
+		self.auto_refresh_check.state(["!disabled"])
+		self.program_state_var.set(f"Program state: {self._extract_program_state(state['program_state'])}")
+		for name, var, label in (
+			("safety_mode", self.safety_mode_var, "Safety"),
+			("robot_mode", self.robot_mode_var, "Robot"),
+			("control_mode", self.control_mode_var, "Control Mode"),
+			("operational_mode", self.operational_mode_var, "Operational Mode"),
+		):
+			if state[name] is not None:
+				var.set(f"{label}: {self._extract_mode(state[name])}")
+
+	def _on_connect_failed(self, _err) -> None:
+		self._apply_connect_ui("Connection Failed", "red", "normal")
+		# Don't keep polling a controller we can't reach
+		self._stop_auto_refresh()
+		self.auto_refresh_check.state(["disabled"])
+
+	def _apply_connect_ui(self, status: str, color: str, button_state: str) -> None:
+		"""Update the connection label, indicator and Connect button together.
+
+		Tk defers redraws to idle time, so the three changes render in one pass.
+		"""
+		self.connection_status_var.set(status)
+		self.set_indicator(color)
+		self.connect_button.configure(state=button_state)
+
+	def _dispatch_action(self, api_call, initial_message: str, success_message: str) -> None:
+		"""Generic handler for robot state and program action buttons.
+
+		The API call and log messages are bound once per button when the UI is built.
+		"""
 		self._execute_api_call(
-			api_call=lambda: self.client.set_robot_state(action),
-			initial_message=f"Sending robot state action: {action}",
-			success_message=f"Robot state action '{action}' succeeded.",
+			api_call=api_call,
+			initial_message=initial_message,
+			success_message=success_message,
 		)
 
 	def on_load_program(self) -> None:
@@ -424,105 +748,118 @@ class RemoteRobotControllerApp:
 			return
 
 		self._execute_api_call(
-			api_call=lambda: self.client.load_program(name),
+			api_call=functools.partial(self.client.load_program, name),
 			initial_message=f"Loading program: {name}",
 			success_message=f"Program '{name}' loaded successfully.",
 		)
 
-	def _send_program_action(self, action: str) -> None:
-		"""Generic handler for program actions."""
-		self._execute_api_call(
-			api_call=lambda: self.client.set_program_action(action),
-			initial_message=f"Sending program action: {action}",
-			success_message=f"Program action '{action}' succeeded.",
-		)
-
 	def on_refresh_program_state(self) -> None:
+		self._refresh_program_state()
+
+	def _refresh_program_state(self, quiet: bool = False, on_error_callback=None, on_finally=None) -> None:
+		"""Fetch and display the program state; quiet skips the info and debug log lines (used by polling)."""
 		def on_success_callback(resp: dict):
-			# Try to find a 'state' key; otherwise show raw
-			state_text = None
-			if isinstance(resp, dict):
-				if "state" in resp:
-					state_text = str(resp.get("state"))
-				elif "programState" in resp:
-					state_text = str(resp.get("programState"))
-				elif "_raw" in resp:
-					state_text = resp.get("_raw")
-			if not state_text:
-				state_text = json.dumps(resp)
-			self.program_state_var.set(f"Program state: {state_text}")
+			self.program_state_var.set(f"Program state: {self._extract_program_state(resp)}")
 
 		self._execute_api_call(
 			api_call=self.client.get_program_state,
-			initial_message="Refreshing program state...",
-			success_message="Program state refreshed.",
+			initial_message=None if quiet else "Refreshing program state...",
+			success_message=None if quiet else "Program state refreshed.",
 			on_success_callback=on_success_callback,
+			on_error_callback=on_error_callback,
+			on_finally=on_finally,
+			quiet=quiet,
 		)
 
-	def on_refresh_system_status(self) -> None:
-		def update_control_mode():
-			def on_success_callback(resp: dict):
-				mode = resp.get("mode", "-") if isinstance(resp, dict) else "-"
-				self.control_mode_var.set(f"Control Mode: {mode}")
-			
-			self._execute_api_call(
-				api_call=self.client.get_control_mode,
-				on_success_callback=on_success_callback,
-			)
+	def on_toggle_auto_refresh(self) -> None:
+		if self.auto_refresh_var.get():
+			self.append_log("Program state auto-refresh enabled.")
+			# A poll still in flight reschedules itself when it completes
+			if not self._auto_refresh_in_flight:
+				self._tick_refresh()
+		else:
+			self._stop_auto_refresh()
+			self.append_log("Program state auto-refresh disabled.")
+
+	def _stop_auto_refresh(self) -> None:
+		self.auto_refresh_var.set(False)
+		if self._auto_refresh_after_id is not None:
+			self.root.after_cancel(self._auto_refresh_after_id)
+			self._auto_refresh_after_id = None
+
+	def _tick_refresh(self) -> None:
+		"""Poll the program state once, then schedule the next poll after it completes."""
+		self._auto_refresh_after_id = None
+		if not self.auto_refresh_var.get():
+			return
 
-		def update_operational_mode():
-			def on_success_callback(resp: dict):
-				mode = resp.get("mode", "-") if isinstance(resp, dict) else "-"
-				self.operational_mode_var.set(f"Operational Mode: {mode}")
-			
-			self._execute_api_call(
-				api_call=self.client.get_operational_mode,
-				on_success_callback=on_success_callback,
-			)
+		def on_error_callback(_err):
+			self._stop_auto_refresh()
+			self.append_log("Program state auto-refresh stopped after an error.")
 
-		self.append_log("Refreshing system status...")
-		update_control_mode()
-		update_operational_mode()
+		def on_finally():
+			self._auto_refresh_in_flight = False
+			if self.auto_refresh_var.get():
+				self._auto_refresh_after_id = self.root.after(AUTO_REFRESH_MS, self._tick_refresh)
 
-	def on_refresh_robot_status(self) -> None:
-		def update_safety_mode():
-			def on_success_callback(resp: dict):
-				mode = resp.get("mode", "-") if isinstance(resp, dict) else "-"
-				self.safety_mode_var.set(f"Safety: {mode}")
-			
-			self._execute_api_call(
-				api_call=self.client.get_safety_mode,
-				on_success_callback=on_success_callback,
-			)
+		self._auto_refresh_in_flight = True
+		self._refresh_program_state(quiet=True, on_error_callback=on_error_callback, on_finally=on_finally)
 
-		def update_robot_mode():
-			def on_success_callback(resp: dict):
-				mode = resp.get("mode", "-") if isinstance(resp, dict) else "-"
-				self.robot_mode_var.set(f"Robot: {mode}")
-			
-			self._execute_api_call(
-				api_call=self.client.get_robot_mode,
-				on_success_callback=on_success_callback,
-			)
+	@staticmethod
+	def _extract_program_state(resp: dict) -> str:
+		# Try to find a 'state' key; otherwise show raw
+		state_text = None
+		if isinstance(resp, dict):
+			if "state" in resp:
+				state_text = str(resp.get("state"))
+			elif "programState" in resp:
+				state_text = str(resp.get("programState"))
+			elif "_raw" in resp:
+				state_text = resp.get("_raw")
+		if not state_text:
+			state_text = json.dumps(resp)
+		return state_text
+
+	@staticmethod
+	def _extract_mode(resp: dict) -> str:
+		return resp.get("mode", "-") if isinstance(resp, dict) else "-"
+
+	def on_refresh_system_status(self) -> None:
+		def on_success_callback(resps: list):
+			control, operational = (self._extract_mode(resp) for resp in resps)
+			self.control_mode_var.set(f"Control Mode: {control}")
+			self.operational_mode_var.set(f"Operational Mode: {operational}")
+
+		self._execute_api_call(
+			api_call=(self.client.get_control_mode, self.client.get_operational_mode),
+			initial_message="Refreshing system status...",
+			on_success_callback=on_success_callback,
+		)
+
+	def on_refresh_robot_status(self) -> None:
+		def on_success_callback(resps: list):
+			safety, robot = (self._extract_mode(resp) for resp in resps)
+			self.safety_mode_var.set(f"Safety: {safety}")
+			self.robot_mode_var.set(f"Robot: {robot}")
 
-		self.append_log("Refreshing robot status...")
-		update_safety_mode()
-		update_robot_mode()
+		self._execute_api_call(
+			api_call=(self.client.get_safety_mode, self.client.get_robot_mode),
+			initial_message="Refreshing robot status...",
+			on_success_callback=on_success_callback,
+		)
 
 	def on_get_programs_list(self) -> None:
 		def on_success_callback(resp: dict):
 			if isinstance(resp, dict) and "programs" in resp:
 				programs = resp.get("programs", [])
 				if programs:
-					programs_text = "\n".join([
-						f"  - {prog.get('name', 'Unknown')}" if isinstance(prog, dict) else f"  - {prog}"
-						for prog in programs
-					])
-					self.append_log(f"Available programs ({len(programs)}):\n{programs_text}")
+					# Use the bullet as the join separator instead of formatting each line
+					names = [str(prog.get('name', 'Unknown')) if isinstance(prog, dict) else str(prog) for prog in programs]
+					self.append_log(f"Available programs ({len(programs)}):\n  - " + "\n  - ".join(names))
 				else:
 					self.append_log("No programs found on the robot.")
 			else:
-				self.append_log(f"Programs list response: {json.dumps(resp, indent=2)}")
+				self.append_log(f"Programs list response: {dumps_pretty(resp)}")
 
 		self._execute_api_call(
 			api_call=self.client.get_programs_list,
@@ -533,7 +870,7 @@ class RemoteRobotControllerApp:
 
 
 def main() -> None:
-	root = tk.Tk()
+	root = AsyncTk()
 	app = RemoteRobotControllerApp(root)
 	root.minsize(720, 420)
 	root.mainloop()
@@ -1,6 +1,40 @@
+import functools
+import http.client
+import io
 import json
+import select
+import threading
+import urllib.error
 import urllib.parse
-import urllib.request
+
+try:
+	import orjson  # optional: faster JSON encode/decode
+except ImportError:
+	orjson = None
+
+
+def _dumps(obj) -> bytes:
+	"""Serialize obj to compact JSON bytes, using orjson when available."""
+	if orjson is not None:
+		return orjson.dumps(obj)
+	return json.dumps(obj).encode("utf-8")
+
+
+def loads(data: bytes):
+	"""Parse JSON bytes (no separate decode step), using orjson when available."""
+	if orjson is not None:
+		return orjson.loads(data)
+	return json.loads(data)
+
+
+def dumps_pretty(obj) -> str:
+	"""Serialize obj as 2-space indented JSON, using orjson when available."""
+	if orjson is not None:
+		try:
+			return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+		except TypeError:
+			pass  # e.g. non-str keys; let stdlib json handle it
+	return json.dumps(obj, indent=2)
 
 
 def ensure_http_scheme(host: str) -> str:
@@ -10,20 +44,88 @@ def ensure_http_scheme(host: str) -> str:
 	"""
 	if not host:
 		return host
-	parsed = urllib.parse.urlparse(host)
-	# Check if scheme is missing or not a valid HTTP scheme
-	if not parsed.scheme or parsed.scheme not in ("http", "https"):
-		return f"http://{host}"
-	return host
+	# A plain prefix check: urlparse would read "localhost:50020" or an IPv6
+	# literal as having a scheme
+	if host[:8].lower().startswith(("http://", "https://")):
+		return host
+	return f"http://{host}"
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_payload(items: tuple) -> bytes:
+	"""JSON-encode a flat payload of string values given as sorted (key, value) pairs.
+
+	Request payloads come from a small fixed set (e.g. {"action": "play"}),
+	so each distinct one is encoded only once. Only string values are cached:
+	the cache keys on equality, which would conflate True, 1 and 1.0.
+	"""
+	return _dumps(dict(items))
+
+
+@functools.lru_cache(maxsize=64)
+def _split_url(url: str) -> tuple[str, str, str]:
+	"""Split a URL into (scheme, netloc, request target) for http.client.
+
+	The client only talks to a handful of fixed endpoint URLs, so each one is
+	parsed once.
+	"""
+	parts = urllib.parse.urlsplit(url)
+	target = parts.path or "/"
+	if parts.query:
+		target = f"{target}?{parts.query}"
+	return parts.scheme, parts.netloc, target
+
+
+# Fixed API endpoints, relative to the robot-api base URL. Full URLs are
+# precomputed per host in RobotApiClient.set_host.
+_ENDPOINTS = {
+	"program_state": "/program/v1/state",
+	"program_load": "/program/v1/load",
+	"robot_state": "/robotstate/v1/state",
+	"safety_mode": "/robotstate/v1/safetymode",
+	"robot_mode": "/robotstate/v1/robotmode",
+	"control_mode": "/system/v1/controlmode",
+	"operational_mode": "/system/v1/operationalmode",
+	"programs": "/programs/v1",
+}
+
+
+# Exceptions raised when a pooled keep-alive connection was closed by the server
+# while idle; the request is retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+def _is_connection_dropped(conn: http.client.HTTPConnection) -> bool:
+	"""Return True if an idle keep-alive connection was closed by the server.
+
+	An idle HTTP connection has nothing to read, so a readable socket means
+	EOF or a reset is pending (the same check urllib3 uses).
+	"""
+	sock = conn.sock
+	if sock is None:
+		return True
+	try:
+		readable, _, _ = select.select([sock], [], [], 0)
+	except (OSError, ValueError):
+		return True
+	return bool(readable)
 
 
 class RobotApiClient:
-	"""Minimal HTTP client for the robot REST API using urllib (stdlib only)."""
+	"""Minimal HTTP client for the robot REST API (stdlib only).
+
+	Connections are kept alive and reused across calls (one idle pool per
+	scheme/host/port), so repeated requests skip the TCP/TLS handshake.
+	The client is safe to use from several worker threads at once.
+	"""
 
 	def __init__(self, host: str | None = None, timeout_seconds: float = 10.0) -> None:
 		self._timeout_seconds = timeout_seconds
 		self._base_url = ""
-		self._last_response_metadata: dict = {}  # Store metadata for debug purposes
+		self._local = threading.local()  # Per-thread last response metadata, for debug purposes
+		self._idle_connections: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+		self._pool_lock = threading.Lock()
+		self._urls = dict(_ENDPOINTS)
 		if host:
 			self.set_host(host)
 
@@ -31,98 +133,186 @@ class RobotApiClient:
 		# Base URL format: http://{host}/universal-robots/robot-api
 		base = ensure_http_scheme(host).rstrip("/")
 		self._base_url = f"{base}/universal-robots/robot-api"
+		self._urls = {name: self._build_url(path) for name, path in _ENDPOINTS.items()}
+		# Connections to a previous host are no longer useful
+		self.close()
+
+	def close(self) -> None:
+		"""Close all idle keep-alive connections. The client stays usable afterwards."""
+		with self._pool_lock:
+			idle = [conn for conns in self._idle_connections.values() for conn in conns]
+			self._idle_connections.clear()
+		for conn in idle:
+			conn.close()
 
 	def _build_url(self, path: str) -> str:
 		return f"{self._base_url}{path}"
 
 	def get_last_response_metadata(self) -> dict:
-		"""Return metadata from the last successful HTTP response for debug purposes."""
-		return self._last_response_metadata.copy()
+		"""Return metadata from the last successful HTTP response made on the calling thread.
+
+		Metadata is kept per thread so that concurrent calls from the app's worker
+		threads don't overwrite each other's. Headers are stored as the response's
+		message object and only copied into a dict here, since this is called
+		solely when debug output is shown.
+		"""
+		metadata = getattr(self._local, "last_response_metadata", {}).copy()
+		if "headers" in metadata:
+			metadata["headers"] = dict(metadata["headers"])
+		return metadata
+
+	def _acquire_connection(self, scheme: str, netloc: str) -> tuple[http.client.HTTPConnection, bool]:
+		"""Return an idle pooled connection (reused=True) or a new one (reused=False).
+
+		Idle connections the server has since closed are discarded here, before
+		anything is sent on them.
+		"""
+		while True:
+			with self._pool_lock:
+				idle = self._idle_connections.get((scheme, netloc))
+				conn = idle.pop() if idle else None
+			if conn is None:
+				break
+			if not _is_connection_dropped(conn):
+				return conn, True
+			conn.close()
+		conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+		return conn_cls(netloc, timeout=self._timeout_seconds), False
+
+	def _release_connection(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+		with self._pool_lock:
+			self._idle_connections.setdefault((scheme, netloc), []).append(conn)
+
+	def _send(self, method: str, url: str, data_bytes: bytes | None, headers: dict) -> tuple[http.client.HTTPResponse, bytes]:
+		"""Send one request over a pooled connection and return the response with its full body."""
+		scheme, netloc, target = _split_url(url)
+		while True:
+			conn, reused = self._acquire_connection(scheme, netloc)
+			sent = False
+			try:
+				conn.request(method, target, body=data_bytes, headers=headers)
+				sent = True
+				resp = conn.getresponse()
+				# The body must be fully read before the connection can be reused
+				raw = resp.read()
+			except _STALE_CONNECTION_ERRORS as err:
+				conn.close()
+				# Server dropped the idle connection; retry on a new one. Commands
+				# (PUT) are only retried if they failed before being sent, so a
+				# robot action can't run twice.
+				if reused and (method == "GET" or not sent):
+					continue
+				raise urllib.error.URLError(err) from err
+			except OSError as err:
+				conn.close()
+				raise urllib.error.URLError(err) from err
+			except Exception:
+				conn.close()
+				raise
+			if resp.will_close:
+				conn.close()
+			else:
+				self._release_connection(scheme, netloc, conn)
+			return resp, raw
 
 	def _request(self, method: str, path: str, payload: dict | None = None) -> dict:
-		url = self._build_url(path)
+		return self._request_url(method, self._build_url(path), payload)
+
+	def _request_url(self, method: str, url: str, payload: dict | None = None, parse_json: bool = True) -> dict:
+		"""Send a request to a full URL and return the decoded response body.
+
+		With parse_json=False the body is still read (so the connection can be
+		reused) but not decoded, and an empty dict is returned. Commands whose
+		acknowledgement the app never inspects use this.
+		"""
+		if not self._base_url:
+			# Fail before touching the network (an empty host would become a DNS lookup)
+			raise ValueError("No robot host set; connect to a host first")
 		data_bytes = None
 		headers = {"Accept": "application/json"}
 		if payload is not None:
-			data_bytes = json.dumps(payload).encode("utf-8")
+			if all(type(value) is str for value in payload.values()):
+				data_bytes = _encode_payload(tuple(sorted(payload.items())))
+			else:
+				data_bytes = _dumps(payload)
 			headers["Content-Type"] = "application/json"
 
+		# Port of the original request (":50020"), re-applied to absolute
+		# redirects that omit one; computed once, outside the redirect loop
+		original_netloc = url.partition("://")[2].split("/", 1)[0]
+		original_port_suffix = f":{original_netloc.rsplit(':', 1)[1]}" if ":" in original_netloc else ""
+
 		# Follow up to 3 redirects (e.g., 307 http -> https) for non-GET as well
 		max_redirects = 3
 		for _ in range(max_redirects + 1):
-			req = urllib.request.Request(url=url, data=data_bytes, headers=headers, method=method)
-			try:
-				with urllib.request.urlopen(req, timeout=self._timeout_seconds) as resp:
-					# Store metadata for debug purposes
-					self._last_response_metadata = {
-						"method": method,
-						"url": url,
-						"status": resp.status,
-						"headers": dict(resp.headers),
-						"request_body": payload,
-					}
-					content_type = resp.headers.get("Content-Type", "")
-					raw = resp.read()
-					if "application/json" in content_type:
-						try:
-							return json.loads(raw.decode("utf-8")) if raw else {}
-						except json.JSONDecodeError:
-							# Fall back to text when payload isn't valid JSON
-							return {"_raw": raw.decode("utf-8", errors="replace")}
+			resp, raw = self._send(method, url, data_bytes, headers)
+			location = resp.headers.get("Location")
+			# 307/308 preserve the method and body; 301-303 are only followed for GET
+			if location and (resp.status in (307, 308) or (resp.status in (301, 302, 303) and method == "GET")):
+				# If an absolute redirect drops the port, keep the original one
+				# (e.g. URSim on localhost:50020 redirecting to https://localhost/...)
+				# Relative locations are left to urljoin, which keeps the port
+				if original_port_suffix and location.startswith(("http://", "https://")):
+					netloc_start = location.index("://") + 3
+					netloc_end = netloc_start
+					while netloc_end < len(location) and location[netloc_end] not in "/?#":
+						netloc_end += 1
+					if ":" not in location[netloc_start:netloc_end]:
+						location = f"{location[:netloc_end]}{original_port_suffix}{location[netloc_end:]}"
+
+				url = urllib.parse.urljoin(url, location)
+				continue
+			if resp.status >= 300:
+				# Surface error responses, and redirects that weren't followed
+				# (so the request never ran), the same way urlopen does
+				raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(raw))
+
+			# Store metadata for debug purposes
+			self._local.last_response_metadata = {
+				"method": method,
+				"url": url,
+				"status": resp.status,
+				"headers": resp.headers,
+				"request_body": payload,
+			}
+			if not parse_json:
+				return {}
+			content_type = resp.headers.get("Content-Type", "")
+			if "application/json" in content_type:
+				try:
+					return loads(raw) if raw else {}
+				except ValueError:  # JSONDecodeError, or invalid UTF-8
+					# Fall back to text when payload isn't valid JSON
 					return {"_raw": raw.decode("utf-8", errors="replace")}
-			except urllib.error.HTTPError as err:
-				# Handle explicit redirect for methods like PUT: 307/308
-				if err.code in (307, 308):
-					location = err.headers.get("Location") if err.headers else None
-					if location:
-						# Parse both URLs to preserve port from original if redirect strips it
-						original_parsed = urllib.parse.urlparse(url)
-						location_parsed = urllib.parse.urlparse(location)
-						
-						# If redirect is absolute but missing port, preserve original port
-						if location_parsed.scheme and location_parsed.netloc:
-							# Check if location has no port but original does
-							if ':' in original_parsed.netloc and ':' not in location_parsed.netloc:
-								# Extract port from original
-								original_host, original_port = original_parsed.netloc.rsplit(':', 1)
-								# Add port to redirect location
-								new_netloc = f"{location_parsed.netloc}:{original_port}"
-								location_parsed = location_parsed._replace(netloc=new_netloc)
-								location = urllib.parse.urlunparse(location_parsed)
-						
-						url = urllib.parse.urljoin(url, location)
-						continue
-				# Propagate other HTTP errors to caller
-				raise
+			return {"_raw": raw.decode("utf-8", errors="replace")}
+		raise urllib.error.HTTPError(url, resp.status, "Too many redirects", resp.headers, io.BytesIO(raw))
 
 	def get_program_state(self) -> dict:
-		return self._request("GET", "/program/v1/state")
+		return self._request_url("GET", self._urls["program_state"])
 
 	def set_program_action(self, action: str) -> dict:
-		return self._request("PUT", "/program/v1/state", {"action": action})
+		return self._request_url("PUT", self._urls["program_state"], {"action": action}, parse_json=False)
 
 	def load_program(self, program_name: str) -> dict:
-		return self._request("PUT", "/program/v1/load", {"programName": program_name})
+		return self._request_url("PUT", self._urls["program_load"], {"programName": program_name}, parse_json=False)
 
 	def set_robot_state(self, action: str) -> dict:
-		return self._request("PUT", "/robotstate/v1/state", {"action": action})
+		return self._request_url("PUT", self._urls["robot_state"], {"action": action}, parse_json=False)
 
 	def get_safety_mode(self) -> dict:
-		return self._request("GET", "/robotstate/v1/safetymode")
+		return self._request_url("GET", self._urls["safety_mode"])
 
 	def get_robot_mode(self) -> dict:
-		return self._request("GET", "/robotstate/v1/robotmode")
+		return self._request_url("GET", self._urls["robot_mode"])
 
 	def get_control_mode(self) -> dict:
-		return self._request("GET", "/system/v1/controlmode")
+		return self._request_url("GET", self._urls["control_mode"])
 
 	def get_operational_mode(self) -> dict:
-		return self._request("GET", "/system/v1/operationalmode")
+		return self._request_url("GET", self._urls["operational_mode"])
 
 	def get_programs_list(self) -> dict:
-		return self._request("GET", "/programs/v1")
+		return self._request_url("GET", self._urls["programs"])
 
 	def get_program_by_name(self, name: str) -> dict:
 		return self._request("GET", f"/programs/v1/{name}")
-
-